@@ -1,41 +1,47 @@
 import argparse
 import requests
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import parse_qs, urlparse
 
 
 def get_repos(token: str):
 
     url = 'https://api.github.com/user/repos'
-    headers = {
+    session = requests.Session()
+    session.headers.update({
         'Authorization': f'token {token}',
-        'Accept': 'application/vnd.github.v3+json'
-    }
+        'Accept': 'application/vnd.github.v3+json',
+        'Accept-Encoding': 'gzip'
+    })
+
+    def get_page(page_num: int):
+        print(f"Page {page_num}")
+        response = session.get(url, params={'page': page_num, 'per_page': 100})
+        response.raise_for_status()
+        return response
+
+    # The first page tells us how many pages there are
+    response = get_page(1)
+
+    last_page = 1
+    if 'last' in response.links:
+        query = urlparse(response.links['last']['url']).query
+        last_page = int(parse_qs(query)['page'][0])
+
+    pages = [response]
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        pages.extend(executor.map(get_page, range(2, last_page + 1)))
 
     res = []
-    page_num = 1
-
-    while url:
-        print("Page " + str(page_num))
-        response = requests.get(url, headers=headers)
-        if response.status_code == 200:
-            repos = response.json()
-            for repo in repos:
-                # print(repo['full_name'])
-                res.append({
-                    'full_name': repo['full_name'],
-                    'fork': repo['fork'],
-                    'stars': repo['stargazers_count'],
-                    'clone_url': repo['clone_url'],
-                })
-
-            # Check for the 'next' page link
-            page_num = page_num + 1
-            if 'next' in response.links:
-                url = response.links['next']['url']
-            else:
-                url = None
-        else:
-            print(f'Failed to retrieve repositories: {response.status_code}')
-            break
+    for page in pages:
+        for repo in page.json():
+            # print(repo['full_name'])
+            res.append({
+                'full_name': repo['full_name'],
+                'fork': repo['fork'],
+                'stars': repo['stargazers_count'],
+                'clone_url': repo['clone_url'],
+            })
 
     return res
 
@@ -44,6 +50,8 @@ def main():
 
     parser = argparse.ArgumentParser(description='List GitHub repositories.')
     parser.add_argument('token', help='GitHub personal access token')
+    parser.add_argument('--shallow', action='store_true',
+                        help='print shallow clone commands (tip of every branch only)')
     args = parser.parse_args()
 
     token = args.token
@@ -53,6 +61,10 @@ def main():
 
     stars_count = 0
     clone_cmds = []
+    if args.shallow:
+        clone_cmd = "git clone --depth=1 --no-single-branch "
+    else:
+        clone_cmd = "git clone --mirror "
 
     print("Name;Fork;Stars;CloneUrl")
     for repo in repos:
@@ -70,7 +82,7 @@ def main():
             str(repo['stars']) + ";" +
             repo['clone_url']
         )
-        clone_cmds.append("git clone --recursive " + repo['clone_url'])
+        clone_cmds.append(clone_cmd + repo['clone_url'])
         stars_count = stars_count + repo['stars']
 
     print("Stars total: " + str(stars_count))
@@ -78,4 +90,5 @@ def main():
         print(cmd)
 
 
-main()
+if __name__ == '__main__':
+    main()